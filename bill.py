@@ -2,22 +2,245 @@ import sys
 import sqlite3
 import os
 import datetime
-from PyQt6.QtCore import QRegularExpression, QDate
+import bisect
+import contextlib
+import functools
+import logging
+import operator
+from decimal import Decimal, ROUND_HALF_UP
+from PyQt6.QtCore import QRegularExpression, QDate, QTimer, Qt, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QRegularExpressionValidator
-from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QFileDialog, QDateEdit
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTableView, QHeaderView, QAbstractItemView, QFileDialog, QDateEdit
+
+log = logging.getLogger(__name__)
+
+# SQL used on every add/remove, kept as shared constants so sqlite3's statement cache always hits
+SQL_SELECT_ALL = "SELECT item_name, quantity, price, total, date, id FROM bill"
+SQL_INSERT = "INSERT INTO bill (item_name, quantity, price, total, date) VALUES (?, ?, ?, ?, ?)"
+SQL_DELETE_ID = "DELETE FROM bill WHERE id=?"
+SQL_CLEAR = "DELETE FROM bill"
+
+# Validator patterns, compiled once and shared by every window
+QTY_RE = QRegularExpression(r"^\d{1,3}(\.\d{1,2})?$")
+PRICE_RE = QRegularExpression(r"^\d{1,8}(\.\d{1,2})?$")
+DATE_FORMAT = "dd-MM-yyyy"
+# Largest values the validators above let through
+MAX_QUANTITY = 999.99
+MAX_PRICE = 99999999.99
+
+
+UNITS = ("", "One", "Two", "Three", "Four", "Five", "Six", "Seven", "Eight", "Nine", "Ten",
+         "Eleven", "Twelve", "Thirteen", "Fourteen", "Fifteen", "Sixteen", "Seventeen", "Eighteen", "Nineteen")
+TENS = ("", "", "Twenty", "Thirty", "Forty", "Fifty", "Sixty", "Seventy", "Eighty", "Ninety")
+
+# Words for every number below 100, built once at import
+TWO_DIGIT_WORDS = tuple(
+    UNITS[n] if n < 20 else TENS[n // 10] + ('' if n % 10 == 0 else ' ' + UNITS[n % 10])
+    for n in range(100)
+)
+
+
+def convert_three_digits(n):
+    """Convert a number less than 1000 to words"""
+    hundred, rest = divmod(n, 100)
+    if hundred:
+        return UNITS[hundred] + " Hundred" + (' ' + TWO_DIGIT_WORDS[rest] if rest else '')
+    return TWO_DIGIT_WORDS[rest]
+
+
+# Words for every number below 1000, so each grouping is a single lookup
+THREE_DIGIT_WORDS = tuple(convert_three_digits(n) for n in range(1000))
+
+
+@functools.lru_cache(maxsize=4096)
+def num_to_words(n):
+    """Convert a whole number to words using crore, lakh and thousand groupings"""
+    if n == 0:
+        return "Zero"
+
+    crore, n = divmod(n, 10000000)
+    lakh, n = divmod(n, 100000)
+    thousand, hundred = divmod(n, 1000)
+
+    parts = []
+    if crore:
+        parts.append((THREE_DIGIT_WORDS[crore] if crore < 1000 else num_to_words(crore)) + " Crore")
+    if lakh:
+        parts.append(TWO_DIGIT_WORDS[lakh] + " Lakh")
+    if thousand:
+        parts.append(TWO_DIGIT_WORDS[thousand] + " Thousand")
+    if hundred:
+        parts.append(THREE_DIGIT_WORDS[hundred])
+    return ' '.join(parts)
+
+
+@functools.lru_cache(maxsize=4096)
+def currency_to_words(amount):
+    """Convert a numeric amount to rupees and paise in words"""
+    # Round to whole paise once, so e.g. 1.999 becomes 2 rupees rather than 100 paise
+    cents = int(Decimal(str(amount)).quantize(Decimal("0.01"), ROUND_HALF_UP) * 100)
+    rupees, paise = divmod(cents, 100)
+
+    rupees_in_words = num_to_words(rupees)
+
+    if paise > 0:
+        return f"{rupees_in_words} Rupees and {num_to_words(paise)} Paise"
+    return f"{rupees_in_words} Rupees"
+
+
+def parse_amount(text):
+    """Parse a plain decimal number, returning None for partial or invalid input"""
+    # Rejecting non-numbers up front avoids raising ValueError on most keystrokes
+    if not text.replace(".", "", 1).isdecimal():
+        return None
+    return float(text)
+
+
+class BillTableModel(QAbstractTableModel):
+    """Table model backed by a list of (item_name, quantity, price, total, date, id) tuples
+
+    The trailing database id is kept with each row but is not shown as a column.
+    """
+    HEADERS = ["Item Name", "Quantity", "Price", "Total", "Date"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        value = self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.format_value(index.column(), value)
+        if role in (Qt.ItemDataRole.EditRole, Qt.ItemDataRole.UserRole):
+            return value  # Raw value, numbers stay as floats
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)  # Row numbers on the vertical header
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort rows on the raw column values so numbers compare numerically"""
+        if not 0 <= column < len(self.HEADERS):
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        persistent_ids = [self.row_id(index.row()) for index in persistent]
+        self._rows.sort(key=self.sort_key(column), reverse=order == Qt.SortOrder.DescendingOrder)
+        positions = {row[-1]: position for position, row in enumerate(self._rows)}
+        self.changePersistentIndexList(
+            persistent, [self.index(positions[row_id], index.column()) for row_id, index in zip(persistent_ids, persistent)])
+        self.layoutChanged.emit()
+
+    @staticmethod
+    def sort_key(column):
+        """Return the key function that orders rows by the given column"""
+        if column == 4:
+            def date_key(row):
+                """Order dates by day number rather than by their dd-MM-yyyy text"""
+                return QDate.fromString(row[4], DATE_FORMAT).toJulianDay()
+            return date_key
+        return operator.itemgetter(column)
+
+    @staticmethod
+    def format_value(column, value):
+        """Format a raw cell value for display"""
+        if column == 1:
+            return f"{value:g}"
+        if column in (2, 3):
+            return f"{value:,.2f}"
+        return str(value)
+
+    def add_row(self, row, position=None):
+        """Insert a single row at the given position, appending when none is given"""
+        if position is None:
+            position = len(self._rows)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, tuple(row))
+        self.endInsertRows()
+
+    def sorted_position(self, row, column, order):
+        """Return where row belongs among rows already sorted by column in the given order"""
+        key = self.sort_key(column)
+        value = key(row)
+        if order == Qt.SortOrder.AscendingOrder:
+            return bisect.bisect_right(self._rows, value, key=key)
+        # Descending: insert before the first row that sorts below the new one
+        return bisect.bisect_left(range(len(self._rows)), True, key=lambda i: key(self._rows[i]) < value)
+
+    def add_rows(self, rows):
+        """Append several rows to the end of the model with a single insert notification"""
+        rows = [tuple(row) for row in rows]
+        if not rows:
+            return
+        position = len(self._rows)
+        self.beginInsertRows(QModelIndex(), position, position + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def remove_row(self, position):
+        """Remove the row at the given position and return it"""
+        self.beginRemoveRows(QModelIndex(), position, position)
+        row = self._rows.pop(position)
+        self.endRemoveRows()
+        return row
+
+    def set_rows(self, rows):
+        """Replace all rows in the model with a single reset"""
+        self.beginResetModel()
+        self._rows = [tuple(row) for row in rows]
+        self.endResetModel()
+
+    def clear(self):
+        """Remove all rows from the model"""
+        self.set_rows([])
+
+    def display_rows(self):
+        """Return all rows as lists of display strings"""
+        # Same formatting as the on-screen table, skipping the trailing database id
+        columns = range(len(self.HEADERS))
+        return [[self.format_value(column, row[column]) for column in columns] for row in self._rows]
+
+    def row_id(self, position):
+        """Return the database id of the row at the given position"""
+        return self._rows[position][-1]
 
 
 class BillEntrySystem(QWidget):
+    # reportlab styles shared by every PDF export, see pdf_styles()
+    _STYLES = None
+    _TABLE_STYLE = None
+    _FIXED_COLUMN_WIDTHS = None
+    # PDF table text, shared by the table style and the column width calculation
+    PDF_FONT = 'Helvetica'
+    PDF_HEADER_FONT = 'Helvetica-Bold'
+    PDF_FONT_SIZE = 10
+    # Horizontal cell padding in the PDF table (reportlab's 6pt default on each side)
+    PDF_CELL_PADDING = 12
+
     def __init__(self):
         super().__init__()
 
-        print("Window Initialized")  # Ensure the initialization happens
+        log.debug("Window Initialized")
         self.setWindowTitle("Bill Entry System")
         self.setGeometry(100, 100, 600, 400)
 
+        # Running bill total, kept in step with the rows in the table
+        self._total = 0.0
+        # (item_name, quantity, price) parsed by the last successful field check
+        self._pending = None
+        self._total_dirty = False
+
         self.init_db()
         self.init_ui()
 
@@ -35,35 +258,56 @@ class BillEntrySystem(QWidget):
                 os.makedirs(db_folder)
 
             db_path = os.path.join(db_folder, 'bill_entries.db')
-            print(f"Using packaged app database path: {db_path}")
+            log.debug("Using packaged app database path: %s", db_path)
         else:
             # Running in development mode
             db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bill_entries.db')
-            print(f"Using development mode database path: {db_path}")
-
-        self.conn = sqlite3.connect(db_path)
-        self.cursor = self.conn.cursor()
-        self.cursor.execute('''CREATE TABLE IF NOT EXISTS bill (
+            log.debug("Using development mode database path: %s", db_path)
+
+        # Autocommit mode: transactions are opened explicitly in transaction() and save_item_to_db
+        self.conn = sqlite3.connect(db_path, isolation_level=None)
+        for pragma in ("journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY", "cache_size=-20000"):
+            self.conn.execute(f"PRAGMA {pragma}")
+        with self.transaction():
+            self.conn.execute('''CREATE TABLE IF NOT EXISTS bill (
                                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                                 item_name TEXT,
                                 quantity REAL,
                                 price REAL,
                                 total REAL,
                                 date TEXT)''')
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_bill_item_name ON bill(item_name)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_bill_date ON bill(date)")
+
+        # Single item inserts are committed together shortly after the last one
+        self.commit_timer = QTimer(self)
+        self.commit_timer.setSingleShot(True)
+        self.commit_timer.setInterval(500)
+        self.commit_timer.timeout.connect(self.conn.commit)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Run the enclosed statements in one write transaction"""
+        if self.conn.in_transaction:
+            self.conn.commit()  # Flush pending item inserts so a rollback only undoes this block
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except Exception:
+            self.conn.rollback()
+            raise
         self.conn.commit()
 
     def load_data_from_db(self):
         """Load the saved data from the database into the table"""
-        self.cursor.execute("SELECT item_name, quantity, price, total, date FROM bill")
-        rows = self.cursor.fetchall()
+        rows = self.conn.execute(SQL_SELECT_ALL).fetchall()
 
-        for row in rows:
-            row_position = self.table.rowCount()
-            self.table.insertRow(row_position)
-            for col, value in enumerate(row):
-                self.table.setItem(row_position, col, QTableWidgetItem(str(value)))
+        # Populate the view with one model reset and total once from the fetched numbers
+        self.model.set_rows(rows)
+        self.apply_table_sort()
+        self._total = sum(row[3] for row in rows)
 
-        self.calculate_total()
+        self.mark_total_dirty()
 
     def init_ui(self):
         """Initialize the User Interface"""
@@ -73,17 +317,15 @@ class BillEntrySystem(QWidget):
         entry_layout = QHBoxLayout()
         self.item_input = self.create_input_layout(entry_layout, "Item Name:")
 
-        # Corrected the Quantity validator regex
-        quantity_validator = QRegularExpressionValidator(QRegularExpression(r"^\d{1,3}(\.\d{1,2})?$"))
+        quantity_validator = QRegularExpressionValidator(QTY_RE)
         self.quantity_input = self.create_input_layout(entry_layout, "Quantity:", quantity_validator)
 
-        # Corrected the Price validator regex
-        price_validator = QRegularExpressionValidator(QRegularExpression(r"^\d{1,8}(\.\d{1,2})?$"))
+        price_validator = QRegularExpressionValidator(PRICE_RE)
         self.price_input = self.create_input_layout(entry_layout, "Price:", price_validator)
 
         # Date input field (default to current date)
         self.date_input = QDateEdit(QDate.currentDate())  # Default to the current date
-        self.date_input.setDisplayFormat("dd-MM-yyyy")  # Set format to dd-MM-yyyy
+        self.date_input.setDisplayFormat(DATE_FORMAT)  # Set format to dd-MM-yyyy
         self.date_input.setCalendarPopup(True)
 
         # Set minimum date to the current date to prevent future dates
@@ -111,6 +353,12 @@ class BillEntrySystem(QWidget):
 
         self.setLayout(main_layout)
 
+        # Validate once typing pauses rather than on every keystroke
+        self._check_timer = QTimer(self)
+        self._check_timer.setSingleShot(True)
+        self._check_timer.setInterval(50)
+        self._check_timer.timeout.connect(self._do_check_fields)
+
         # Connect field changes to the function that checks validity
         self.item_input.textChanged.connect(self.check_fields)
         self.quantity_input.textChanged.connect(self.check_fields)
@@ -133,7 +381,7 @@ class BillEntrySystem(QWidget):
         self.add_button = QPushButton("Add Item")
         self.add_button.setEnabled(False)
         self.add_button.clicked.connect(self.add_item)
-        self.add_button.clicked.connect(self.calculate_total)
+        self.add_button.clicked.connect(self.mark_total_dirty)
 
         self.remove_button = QPushButton("Remove Item")
         self.remove_button.clicked.connect(self.remove_item)
@@ -153,52 +401,67 @@ class BillEntrySystem(QWidget):
 
     def create_table_widget(self):
         """Create table for displaying the items"""
-        table = QTableWidget()
-        table.setColumnCount(5)  # Added an extra column for the date
-        table.setHorizontalHeaderLabels(["Item Name", "Quantity", "Price", "Total", "Date"])
+        self.model = BillTableModel(self)
+        table = QTableView()
+        table.setModel(self.model)
+        # Keep the load order until a header is clicked
+        table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        table.setSortingEnabled(True)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Uniform row heights, so inserting rows never measures their contents
+        table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         return table
 
     def check_fields(self):
+        """Schedule a validity check of the input fields"""
+        self._pending = None  # Parsed values are stale until the check runs again
+        self._check_timer.start()
+
+    def _do_check_fields(self):
         """Check if all fields are valid, and enable the 'Add Item' button"""
         item_name = self.item_input.text().strip()
-        try:
-            quantity = float(self.quantity_input.text().strip() or 1)  # Default to 1 if empty
-            price = float(self.price_input.text().replace(",", ""))  # Clean price input
-        except ValueError:
+        quantity = parse_amount(self.quantity_input.text().strip() or "1")  # Default to 1 if empty
+        price = parse_amount(self.price_input.text().replace(",", ""))  # Clean price input
+        if quantity is None or price is None:
+            self._pending = None
             self.add_button.setEnabled(False)
             return
 
         if item_name and quantity > 0 and price > 0:
+            # Keep the parsed values so add_item does not parse them again
+            self._pending = (item_name, quantity, price)
             self.add_button.setEnabled(True)
         else:
+            self._pending = None
             self.add_button.setEnabled(False)
 
     def add_item(self):
-        item_name = self.item_input.text()
-        quantity = float(self.quantity_input.text().strip() or 1)
-        price = float(self.price_input.text().replace(",", ""))
-        date = self.date_input.date().toString("dd-MM-yyyy")  # Get the selected date in dd-MM-yyyy format
+        if self._pending is None:
+            # Clicked before the debounced check ran, validate now
+            self._check_timer.stop()
+            self._do_check_fields()
+            if self._pending is None:
+                return
 
-        if item_name and quantity > 0 and price > 0:
-            total = quantity * price
-            self.save_item_to_db(item_name, quantity, price, total, date)
+        item_name, quantity, price = self._pending
+        date = self.date_input.date().toString(DATE_FORMAT)  # Get the selected date in dd-MM-yyyy format
+        self.save_item_to_db(item_name, quantity, price, quantity * price, date)
 
     def save_item_to_db(self, item_name, quantity, price, total, date):
         """Save the item to the database and update the table"""
-        self.cursor.execute("INSERT INTO bill (item_name, quantity, price, total, date) VALUES (?, ?, ?, ?, ?) ",
-                            (item_name, quantity, price, total, date))
-        self.conn.commit()
-
-        row_position = self.table.rowCount()
-        self.table.insertRow(row_position)
-
-        self.table.setItem(row_position, 0, QTableWidgetItem(item_name))
-        self.table.setItem(row_position, 1, QTableWidgetItem(str(quantity)))
-        self.table.setItem(row_position, 2, QTableWidgetItem(str(price)))
-        self.table.setItem(row_position, 3, QTableWidgetItem(str(total)))
-        self.table.setItem(row_position, 4, QTableWidgetItem(date))
+        # Left open until the commit timer fires, so quick successive adds share one commit
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN IMMEDIATE")
+        cursor = self.conn.execute(SQL_INSERT, (item_name, quantity, price, total, date))
+        self.commit_timer.start()
+
+        # Insert straight into place when the table is sorted, rather than re-sorting every row
+        row = (item_name, quantity, price, total, date, cursor.lastrowid)
+        sort_order = self.table_sort_order()
+        self.model.add_row(row, self.model.sorted_position(row, *sort_order) if sort_order else None)
+        self._total += total
 
         # Clear input fields
         self.item_input.clear()
@@ -206,145 +469,183 @@ class BillEntrySystem(QWidget):
         self.price_input.clear()
         self.add_button.setEnabled(False)
 
+    def save_items_bulk(self, rows):
+        """Save many (item_name, quantity, price, total, date) rows in one transaction and update the table"""
+        rows = list(rows)
+        with self.transaction():
+            self.conn.executemany(SQL_INSERT, rows)
+            # AUTOINCREMENT ids are handed out consecutively within the transaction
+            first_id = self.conn.execute("SELECT last_insert_rowid()").fetchone()[0] - len(rows) + 1
+
+        self.model.add_rows((*row, first_id + offset) for offset, row in enumerate(rows))
+        self.apply_table_sort()
+        self._total += sum(row[3] for row in rows)
+
+        self.mark_total_dirty()
+
+    def table_sort_order(self):
+        """Return the (column, order) shown by the header's sort indicator, or None when unsorted"""
+        header = self.table.horizontalHeader()
+        if 0 <= header.sortIndicatorSection() < self.model.columnCount():
+            return header.sortIndicatorSection(), header.sortIndicatorOrder()
+        return None
+
+    def apply_table_sort(self):
+        """Re-sort every row by the header's sort indicator, if any, after bulk changes"""
+        sort_order = self.table_sort_order()
+        if sort_order:
+            self.model.sort(*sort_order)
+
     def remove_item(self):
         """Remove the selected item from the table and database"""
-        selected_row = self.table.currentRow()
+        selected_row = self.table.currentIndex().row()
         if selected_row >= 0:
-            item_id = self.table.item(selected_row, 0).text()
-            self.cursor.execute("DELETE FROM bill WHERE item_name=?", (item_id,))
-            self.conn.commit()
+            item_id = self.model.row_id(selected_row)
+            with self.transaction():
+                self.conn.execute(SQL_DELETE_ID, (item_id,))
 
-            self.table.removeRow(selected_row)
+            removed = self.model.remove_row(selected_row)
+            # Reset once empty so float error cannot leave a stray "-0.00"
+            self._total = self._total - removed[3] if self.model.rowCount() else 0.0
+            self.mark_total_dirty()
 
     def clear_all(self):
         """Clear all items from the table and database"""
-        self.cursor.execute("DELETE FROM bill")
-        self.conn.commit()
-        self.table.setRowCount(0)
+        with self.transaction():
+            self.conn.execute(SQL_CLEAR)
+        self.model.clear()
+        self._total = 0.0
         self.total_label.setText("Total: ₹0.00")
         self.total_in_words_label.setText("Total in Words: Zero Rupees")
 
+    def mark_total_dirty(self):
+        """Schedule one total refresh for however many changes happen before the event loop runs"""
+        if not self._total_dirty:
+            self._total_dirty = True
+            QTimer.singleShot(0, self._flush_total)
+
+    def _flush_total(self):
+        if self._total_dirty:
+            self._total_dirty = False
+            self.calculate_total()
+
     def calculate_total(self):
-        total = sum(float(self.table.item(row, 3).text()) for row in range(self.table.rowCount()))
+        total = self._total
         total_in_words = self.convert_currency_to_words(total)
         self.total_label.setText(f"Total: ₹{total:,.2f}")
         self.total_in_words_label.setText(f"Total in Words: {total_in_words}")
 
-    def download_pdf(self):
-        """Download the table data as a PDF file with the current date as header"""
-        file_name, _ = QFileDialog.getSaveFileName(self, "Save PDF", "", "PDF Files (*.pdf)")
-        if file_name:
-            document = SimpleDocTemplate(file_name, pagesize=A4)
-            data = [
-                [Paragraph("<b>Item Name</b>", getSampleStyleSheet()['Heading4']),
-                 Paragraph("<b>Quantity</b>", getSampleStyleSheet()['Heading4']),
-                 Paragraph("<b>Price</b>", getSampleStyleSheet()['Heading4']),
-                 Paragraph("<b>Total</b>", getSampleStyleSheet()['Heading4']),
-                 Paragraph("<b>Date</b>", getSampleStyleSheet()['Heading4'])]
-            ]
+    @classmethod
+    def pdf_styles(cls):
+        """Return the paragraph stylesheet and table style, building them on first use"""
+        if cls._STYLES is None:
+            from reportlab import rl_config
+            from reportlab.lib.styles import getSampleStyleSheet
+            from reportlab.platypus import TableStyle
 
-            # Populate the table with data from the QTableWidget
-            for row in range(self.table.rowCount()):
-                data.append([self.table.item(row, col).text() for col in range(5)])
-
-            table = Table(data)
-            
+            rl_config.shapeChecking = 0  # Skip per-attribute validation while building documents
+            cls._STYLES = getSampleStyleSheet()
             # Adding padding and style to the table
-            table.setStyle(TableStyle([ 
+            cls._TABLE_STYLE = TableStyle([
                 ('ALIGN', (0, 0), (-1, -1), 'CENTER'),  # Center-align the whole table
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+                ('FONTNAME', (0, 0), (-1, -1), cls.PDF_FONT),
+                ('FONTNAME', (0, 0), (-1, 0), cls.PDF_HEADER_FONT),  # Bold header row
+                ('FONTSIZE', (0, 0), (-1, -1), cls.PDF_FONT_SIZE),
                 ('GRID', (0, 0), (-1, -1), 0.5, (0, 0, 0)),
                 ('ALIGN', (0, 0), (-1, 0), 'CENTER'),  # Center the header row
                 ('TOPPADDING', (0, 0), (-1, 0), 12),  # Add space above the table
                 ('BOTTOMPADDING', (0, 0), (-1, -1), 12),  # Add space below the table
-            ]))
+            ])
+        return cls._STYLES, cls._TABLE_STYLE
+
+    @classmethod
+    def pdf_fixed_column_widths(cls):
+        """Return widths for the Quantity, Price, Total and Date columns, measured once from their widest possible values"""
+        if cls._FIXED_COLUMN_WIDTHS is None:
+            from reportlab.pdfbase.pdfmetrics import stringWidth
+
+            widest_values = (
+                BillTableModel.format_value(1, MAX_QUANTITY),
+                BillTableModel.format_value(2, MAX_PRICE),
+                BillTableModel.format_value(3, MAX_QUANTITY * MAX_PRICE),
+                QDate(2000, 12, 28).toString(DATE_FORMAT),
+            )
+            cls._FIXED_COLUMN_WIDTHS = [
+                max(stringWidth(title, cls.PDF_HEADER_FONT, cls.PDF_FONT_SIZE),
+                    stringWidth(value, cls.PDF_FONT, cls.PDF_FONT_SIZE)) + cls.PDF_CELL_PADDING
+                for title, value in zip(BillTableModel.HEADERS[1:], widest_values)
+            ]
+        return cls._FIXED_COLUMN_WIDTHS
 
-            total = sum(float(self.table.item(row, 3).text()) for row in range(self.table.rowCount()))
+    def download_pdf(self):
+        """Download the table data as a PDF file with the current date as header"""
+        file_name, _ = QFileDialog.getSaveFileName(self, "Save PDF", "", "PDF Files (*.pdf)")
+        if file_name:
+            # reportlab is only needed for exports, so keep it out of startup
+            from reportlab.lib.pagesizes import A4
+            from reportlab.platypus import SimpleDocTemplate, Table, Paragraph
+            from reportlab.lib.enums import TA_CENTER
+            from reportlab.lib.styles import ParagraphStyle
+            from reportlab.pdfbase.pdfmetrics import stringWidth
+            from xml.sax.saxutils import escape
+
+            document = SimpleDocTemplate(file_name, pagesize=A4)
+            styles, table_style = self.pdf_styles()
+            normal = styles['Normal']
+
+            # Plain string cells, the header row is bolded by the table style
+            data = [list(BillTableModel.HEADERS)]
+            data.extend(self.model.display_rows())
+
+            # Fixed widths spare reportlab from measuring every cell, item names get what is left
+            fixed_widths = self.pdf_fixed_column_widths()
+            name_width = document.width - sum(fixed_widths)
+
+            # Deliberate exception to plain string cells: a name too wide for its column is wrapped in a
+            # Paragraph. Names that fit at one em per character are never measured.
+            text_width = name_width - self.PDF_CELL_PADDING
+            max_name_length = int(text_width // self.PDF_FONT_SIZE)
+            name_style = None
+            for row in data[1:]:
+                if (len(row[0]) > max_name_length
+                        and stringWidth(row[0], self.PDF_FONT, self.PDF_FONT_SIZE) > text_width):
+                    if name_style is None:
+                        name_style = ParagraphStyle('ItemName', parent=normal, fontName=self.PDF_FONT,
+                                                    fontSize=self.PDF_FONT_SIZE, alignment=TA_CENTER)
+                    row[0] = Paragraph(escape(row[0]), name_style)
+
+            table = Table(data, colWidths=[name_width, *fixed_widths])
+            table.setStyle(table_style)
+
+            total = self._total
             total_in_words = self.convert_currency_to_words(total)
 
             total_numeric = f"Total: {total:,.2f}"
-            styles = getSampleStyleSheet()
 
-            total_paragraph = Paragraph(f"<b>{total_numeric}</b>", styles['Normal'])
-            total_in_words_paragraph = Paragraph(f"<b>Total in Words:</b> {total_in_words}", styles['Normal'])
+            total_paragraph = Paragraph(f"<b>{total_numeric}</b>", normal)
+            total_in_words_paragraph = Paragraph(f"<b>Total in Words:</b> {total_in_words}", normal)
 
             current_date = datetime.datetime.now().strftime("%B %d, %Y")
-            date_paragraph = Paragraph(f"<b>Date: {current_date}</b>", styles['Normal'])
+            date_paragraph = Paragraph(f"<b>Date: {current_date}</b>", normal)
 
             document.build([date_paragraph, table, total_paragraph, total_in_words_paragraph])
 
-            print(f"PDF saved to {file_name}")
+            log.debug("PDF saved to %s", file_name)
 
     def closeEvent(self, event):
         """Close the connection and ensure the thread is properly terminated"""
+        self.commit_timer.stop()
+        self.conn.commit()  # Flush any pending inserts
         self.conn.close()
         event.accept()
 
     def convert_currency_to_words(self, amount):
         """Convert a numeric amount to words (Indian numbering system)"""
-        units = ["", "One", "Two", "Three", "Four", "Five", "Six", "Seven", "Eight", "Nine", "Ten",
-                "Eleven", "Twelve", "Thirteen", "Fourteen", "Fifteen", "Sixteen", "Seventeen", "Eighteen", "Nineteen"]
-        tens = ["", "", "Twenty", "Thirty", "Forty", "Fifty", "Sixty", "Seventy", "Eighty", "Ninety"]
-
-        def convert_two_digits(n):
-            """Convert a number less than 100 to words"""
-            if n == 0:
-                return ""
-            elif n < 20:
-                return units[n]
-            else:
-                return tens[n // 10] + ('' if n % 10 == 0 else ' ' + units[n % 10])
-
-        def convert_three_digits(n):
-            """Convert a number less than 1000 to words"""
-            if n == 0:
-                return ""
-            elif n < 100:
-                return convert_two_digits(n)
-            else:
-                return units[n // 100] + " Hundred" + ('' if n % 100 == 0 else ' ' + convert_two_digits(n % 100))
-
-        def num_to_words(n):
-            """Convert a number to words for Indian currency system"""
-            if n == 0:
-                return "Zero"
-
-            crore = n // 10000000
-            n %= 10000000
-
-            lakh = n // 100000
-            n %= 100000
-
-            thousand = n // 1000
-            n %= 1000
-
-            hundred = n
-
-            words = []
-            if crore > 0:
-                words.append(convert_two_digits(crore) + " Crore")
-            if lakh > 0:
-                words.append(convert_two_digits(lakh) + " Lakh")
-            if thousand > 0:
-                words.append(convert_two_digits(thousand) + " Thousand")
-            if hundred > 0:
-                words.append(convert_three_digits(hundred))
-
-            return ' '.join(words).strip()
-
-        rupees = int(amount)
-        paise = round((amount - rupees) * 100)
-
-        rupees_in_words = num_to_words(rupees)
-
-        if paise > 0:
-            paise_in_words = num_to_words(paise)
-            return f"{rupees_in_words} Rupees and {paise_in_words} Paise"
-        else:
-            return f"{rupees_in_words} Rupees"
+        return currency_to_words(amount)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)  # Debug messages are skipped before any formatting
     app = QApplication(sys.argv)
     window = BillEntrySystem()
     window.show()
@@ -1,7 +1,7 @@
 import sys
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QFileDialog, QLabel, QListWidget, QHBoxLayout
 from PyQt6.QtCore import Qt
-from PyPDF2 import PdfMerger
+from PyPDF2 import PdfReader, PdfWriter
 
 class PDFMergerApp(QWidget):
     def __init__(self):
@@ -46,14 +46,18 @@ class PDFMergerApp(QWidget):
         self.setLayout(self.layout)
         
         self.pdf_files = []
+        self.pdf_paths = set()  # Same paths as pdf_files, for fast duplicate checks
 
     def select_pdfs(self):
         # Open a file dialog to select one or multiple PDFs
         files, _ = QFileDialog.getOpenFileNames(self, "Select PDFs", "", "PDF Files (*.pdf)")
         
         if files:
-            self.pdf_files.extend(files)  # Add the newly selected files to the list
-            self.update_pdf_list_widget()
+            for pdf in files:
+                if pdf not in self.pdf_paths:  # Skip files that are already in the list
+                    self.pdf_paths.add(pdf)
+                    self.pdf_files.append(pdf)
+                    self.pdf_list_widget.addItem(pdf)
             self.merge_button.setEnabled(True)
 
     def update_pdf_list_widget(self):
@@ -66,8 +70,9 @@ class PDFMergerApp(QWidget):
         selected_items = self.pdf_list_widget.selectedItems()
         if selected_items:
             for item in selected_items:
-                self.pdf_files.remove(item.text())
-                self.pdf_list_widget.takeItem(self.pdf_list_widget.row(item))
+                row = self.pdf_list_widget.row(item)
+                self.pdf_paths.discard(self.pdf_files.pop(row))
+                self.pdf_list_widget.takeItem(row)
             if not self.pdf_files:
                 self.merge_button.setEnabled(False)  # Disable merge button if no files are selected
 
@@ -78,9 +83,10 @@ class PDFMergerApp(QWidget):
             for item in selected_items:
                 row = self.pdf_list_widget.row(item)
                 if row > 0:
-                    # Swap items in the list widget
+                    # Swap the files and move just this row in the list widget
                     self.pdf_files[row], self.pdf_files[row - 1] = self.pdf_files[row - 1], self.pdf_files[row]
-                    self.update_pdf_list_widget()
+                    self.pdf_list_widget.insertItem(row - 1, self.pdf_list_widget.takeItem(row))
+                    self.pdf_list_widget.setCurrentRow(row - 1)
 
     def move_down(self):
         """Move the selected PDF down in the list."""
@@ -89,9 +95,10 @@ class PDFMergerApp(QWidget):
             for item in selected_items:
                 row = self.pdf_list_widget.row(item)
                 if row < len(self.pdf_files) - 1:
-                    # Swap items in the list widget
+                    # Swap the files and move just this row in the list widget
                     self.pdf_files[row], self.pdf_files[row + 1] = self.pdf_files[row + 1], self.pdf_files[row]
-                    self.update_pdf_list_widget()
+                    self.pdf_list_widget.insertItem(row + 1, self.pdf_list_widget.takeItem(row))
+                    self.pdf_list_widget.setCurrentRow(row + 1)
 
     def merge_pdfs(self):
         if not self.pdf_files:
@@ -101,17 +108,25 @@ class PDFMergerApp(QWidget):
         save_path, _ = QFileDialog.getSaveFileName(self, "Save Merged PDF", "", "PDF Files (*.pdf)")
         
         if save_path:
-            # Merge the selected PDFs
-            merger = PdfMerger()
-            for pdf in self.pdf_files:
-                merger.append(pdf)
-            
-            # Write the merged PDF to the selected path
-            merger.write(save_path)
-            merger.close()
+            # Merge the selected PDFs, reading each file through a large buffer
+            writer = PdfWriter()
+            handles = []
+            try:
+                for pdf in self.pdf_files:
+                    handle = open(pdf, 'rb', buffering=1024 * 1024)
+                    handles.append(handle)
+                    writer.append(PdfReader(handle))  # Keeps outlines, unlike append_pages_from_reader
+
+                # Write the merged PDF to the selected path
+                writer.write(save_path)
+            finally:
+                # Pages are read lazily, so the inputs stay open until the write is done
+                for handle in handles:
+                    handle.close()
             
             self.label.setText(f"PDFs merged successfully!\nSaved to: {save_path}")
             self.pdf_files = []  # Clear the list after merging
+            self.pdf_paths.clear()
             self.update_pdf_list_widget()  # Update the list widget
 
 if __name__ == "__main__":